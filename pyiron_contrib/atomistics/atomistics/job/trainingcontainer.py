@@ -28,7 +28,7 @@ name    atoms   energy  forces  number_of_atoms
 Fe_bcc  ...
 """
 
-from typing import Callable, Dict, Any, Optional
+from typing import Callable, Dict, Any, List, Optional
 
 from warnings import catch_warnings
 
@@ -39,6 +39,7 @@ import matplotlib.pyplot as plt
 
 from ase.atoms import Atoms as ASEAtoms
 
+from pyiron_atomistics.atomistics.structure.atom import Atom
 from pyiron_atomistics.atomistics.structure.atoms import Atoms
 from pyiron_atomistics.atomistics.structure.has_structure import HasStructure
 from pyiron_atomistics.atomistics.structure.structurestorage import StructureStorage, StructurePlots
@@ -343,7 +344,7 @@ class TrainingPlots(StructurePlots):
         N = self._store.get_array("length")
         E = self._store.get_array("energy") / N
         neigh = self._calc_neighbors(num_neighbors=num_neighbors)
-        D = np.array([d.min() for d in np.split(neigh['distances'][:, 0], N.cumsum())[:-1]])
+        D = np.minimum.reduceat(neigh['distances'][:, 0], self._store.get_array("start_index"))
         plt.scatter(D, E, marker='.')
 
     def forces(self, axis: Optional[int] = None):
@@ -363,11 +364,227 @@ class TrainingPlots(StructurePlots):
 
 
 class TrainingStorage(StructureStorage):
-    def __init__(self):
-        super().__init__()
+    # set_array() skips writes to these arrays that would not change the stored values, to keep the caches derived
+    # from them valid; for other arrays comparing costs as much as just writing
+    _cached_arrays = ("symbols", "identifier")
+
+    def __init__(self, num_atoms=1, num_structures=1):
+        """
+        Create new training storage.
+
+        Args:
+            num_atoms (int): total number of atoms across all structures to pre-allocate
+            num_structures (int): number of structures to pre-allocate
+        """
+        super().__init__(num_atoms=num_atoms, num_structures=num_structures)
         self.add_array("energy", dtype=np.float64, per="chunk", fill=np.nan)
+        # built on first call to to_pandas()
         self._table_cache = None
-        self.to_pandas()
+        # maps identifiers to structure indices, built on first call to find_chunk()
+        self._identifier_index = None
+
+    def find_chunk(self, identifier):
+        """
+        Return integer index for given identifier.
+
+        Uses a dictionary of identifiers to indices that is kept up to date when adding structures instead of scanning
+        all identifiers.  If an identifier is used multiple times, the index of the first structure is returned.
+
+        Args:
+            identifier (str): name of structure previously passed to :method:`.add_structure`
+
+        Returns:
+            int: integer index for structure
+
+        Raises:
+            KeyError: if identifier is not found in storage
+        """
+        if self._identifier_index is None:
+            self._build_identifier_index()
+        i = self._identifier_index.get(identifier)
+        if i is not None and not self._has_identifier(i, identifier):
+            # stored identifier was changed behind the index's back, e.g. through a view, so rebuild it once
+            self._build_identifier_index()
+            i = self._identifier_index.get(identifier)
+        if i is None:
+            raise KeyError(f"No chunk named {identifier}")
+        return i
+
+    def _build_identifier_index(self):
+        self._identifier_index = {}
+        for i, name in enumerate(self._per_chunk_arrays["identifier"][: len(self)]):
+            self._identifier_index.setdefault(name, i)
+
+    def _has_identifier(self, frame, identifier):
+        return frame < len(self) and self._per_chunk_arrays["identifier"][frame] == identifier
+
+    def add_chunk(self, chunk_length, identifier=None, **arrays):
+        super().add_chunk(chunk_length, identifier=identifier, **arrays)
+        if self._identifier_index is not None:
+            i = self.prev_chunk_index
+            self._identifier_index.setdefault(self._per_chunk_arrays["identifier"][i], i)
+
+    def set_array(self, name, frame, value):
+        """
+        Add array for given structure.
+
+        Works for per chunk and per element arrays.
+
+        :method:`.get_array` returns views into the underlying storage, so modifying its result in place already
+        changes the stored values.  Pass it back afterwards anyway, so that caches derived from it are updated.
+
+        >>> symbols = container.get_array("symbols", 2)
+        >>> symbols[5:10] = "Cu"
+        >>> container.set_array("symbols", 2, symbols)
+
+        Symbols and identifiers equal to the ones already stored are not written again, so that the caches derived from
+        them, for :method:`.get_elements` and :method:`.find_chunk`, stay valid.
+
+        Args:
+            name (str): name of array to set
+            frame (int, str): selects structure to set, as in :method:`.get_strucure()`
+            value: value (for per chunk) or array of values (for per element); type and shape as per :meth:`.hasarray()`.
+
+        Raises:
+            `KeyError`: if array with name does not exists
+        """
+        if isinstance(frame, str):
+            frame = self.find_chunk(frame)
+        # the structure currently added by add_chunk() has no stored values yet, so don't bother comparing
+        if frame < len(self) and name in self._cached_arrays and self._is_unchanged(name, frame, value):
+            return
+        super().set_array(name, frame, value)
+        if name == "identifier":
+            self._identifier_index = None
+
+    def _is_unchanged(self, name, frame, value):
+        """
+        Check whether value is equal to what is already stored for the given array and structure.
+        """
+        current = self.get_array(name, frame)
+        if np.may_share_memory(current, value):
+            # a view returned by get_array() and modified in place always compares equal, but caches are stale
+            return False
+        value = np.asarray(value)
+        return np.shape(current) == value.shape and np.array_equal(current, value)
+
+    def extend(self, other):
+        super().extend(other)
+        self._identifier_index = None
+        self._element_cache = None
+
+    def _from_hdf(self, hdf, version=None):
+        super()._from_hdf(hdf, version=version)
+        self._identifier_index = None
+        self._element_cache = None
+
+    def get_elements(self) -> List[str]:
+        """
+        Return a list of chemical elements present in the storage.
+
+        Only atoms actually added to the storage are considered, not the pre-allocated remainder of the array.  The
+        result is cached until symbols are modified.
+
+        Returns:
+            :class:`list`: list of unique elements as strings of chemical symbols
+        """
+        if self._element_cache is None:
+            self._element_cache = np.unique(
+                self._per_element_arrays["symbols"][: self.current_element_index]
+            ).tolist()
+        return self._element_cache
+
+    def _get_structure(self, frame=-1, wrap_atoms=True):
+        try:
+            magmoms = self.get_array("spins", frame)
+        except KeyError:
+            # not all structures have spins saved on them
+            magmoms = None
+        if self.has_array("selective_dynamics"):
+            selective_dynamics = self.get_array("selective_dynamics", frame)
+        else:
+            selective_dynamics = None
+        return self._to_structure(
+            symbols=self.get_array("symbols", frame),
+            positions=self.get_array("positions", frame),
+            cell=self.get_array("cell", frame),
+            pbc=self.get_array("pbc", frame),
+            magmoms=magmoms,
+            selective_dynamics=selective_dynamics,
+        )
+
+    def iter_structures(self, wrap_atoms=True):
+        """
+        Iterate over all structures in this object.
+
+        All arrays are looked up once and then sliced directly for every structure, instead of going through
+        :method:`.get_structure` and :method:`.get_array` for each of them.
+
+        Args:
+            wrap_atoms (bool): unused, atoms are returned as stored, just like from :meth:`.get_structure()`
+
+        Yields:
+            :class:`pyiron_atomistics.atomistitcs.structure.atoms.Atoms`: every structure attached to the object
+        """
+        start_index = self._per_chunk_arrays["start_index"]
+        length = self._per_chunk_arrays["length"]
+        symbols = self._per_element_arrays["symbols"]
+        positions = self._per_element_arrays["positions"]
+        cell = self._per_chunk_arrays["cell"]
+        pbc = self._per_chunk_arrays["pbc"]
+        spins = self._per_element_arrays.get("spins")
+        selective_dynamics = self._per_element_arrays.get("selective_dynamics")
+        species = {}
+        for i in range(len(self)):
+            atoms = slice(start_index[i], start_index[i] + length[i])
+            yield self._to_structure(
+                symbols=symbols[atoms],
+                positions=positions[atoms],
+                cell=cell[i],
+                pbc=pbc[i],
+                magmoms=spins[atoms] if spins is not None else None,
+                selective_dynamics=selective_dynamics[atoms] if selective_dynamics is not None else None,
+                species=species,
+            )
+
+    @staticmethod
+    def _to_structure(symbols, positions, cell, pbc, magmoms=None, selective_dynamics=None, species=None):
+        """
+        Create structure from the stored arrays of a single structure.
+
+        Args:
+            symbols (ndarray): chemical symbols of all atoms
+            positions (ndarray): positions of all atoms
+            cell (ndarray): simulation cell
+            pbc (ndarray): periodic boundary conditions
+            magmoms (ndarray, optional): magnetic moments of all atoms
+            selective_dynamics (ndarray, optional): per atom selective dynamics flags
+            species (dict, optional): cache of chemical elements by symbol, shared when creating many structures
+
+        Returns:
+            :class:`pyiron_atomistics.atomistitcs.structure.atoms.Atoms`: new structure
+        """
+        if species is None:
+            species = {}
+        # np.unique returns the present elements sorted like get_elements() and the per atom species index in a single
+        # vectorized call, instead of looking up the symbol of every atom in python
+        elements, indices = np.unique(symbols, return_inverse=True)
+        for e in elements:
+            if e not in species:
+                species[e] = Atom(e).element
+        structure = Atoms(
+            species=[species[e] for e in elements],
+            indices=indices,
+            positions=positions,
+            cell=cell,
+            pbc=pbc,
+            magmoms=magmoms,
+        )
+        if selective_dynamics is not None:
+            structure.add_tag(selective_dynamics=[True, True, True])
+            for i, d in enumerate(selective_dynamics):
+                structure.selective_dynamics[i] = d.tolist()
+        return structure
 
     def to_pandas(self):
         """
@@ -385,20 +602,19 @@ class TrainingStorage(StructureStorage):
             :class:`pandas.DataFrame`: collected structures
         """
         if self._table_cache is None or len(self._table_cache) != len(self):
+            # per structure columns are read as a whole instead of one numpy scalar per structure
             self._table_cache = pd.DataFrame(
                 {
-                    "name": [self.get_array("identifier", i) for i in range(len(self))],
-                    "atoms": [self.get_structure(i) for i in range(len(self))],
-                    "energy": [self.get_array("energy", i) for i in range(len(self))],
+                    "name": self.get_array("identifier").tolist(),
+                    "atoms": list(self.iter_structures()),
+                    "energy": self.get_array("energy"),
                 }
             )
             if self.has_array("forces"):
-                self._table_cache["forces"] = [self.get_array("forces", i) for i in range(len(self))]
+                self._table_cache["forces"] = list(self.get_array_ragged("forces"))
             if self.has_array("stress"):
-                self._table_cache["stress"] = [self.get_array("stress", i) for i in range(len(self))]
-            self._table_cache["number_of_atoms"] = [
-                len(s) for s in self._table_cache.atoms
-            ]
+                self._table_cache["stress"] = list(self.get_array("stress"))
+            self._table_cache["number_of_atoms"] = self.get_array("length").astype(int)
         return self._table_cache
 
     def include_job(self, job, iteration_step=-1):
@@ -529,16 +745,45 @@ class TrainingStorage(StructureStorage):
             raise ValueError(
                 "At least columns 'name', 'atoms' and 'energy' must be present in dataset!"
             )
-        for row in dataset.itertuples(index=False):
-            kwargs = {}
-            if hasattr(row, "forces"):
-                kwargs["forces"] = row.forces
-            if hasattr(row, "stress"):
-                kwargs["stress"] = row.stress
+        # size of the whole dataset is known up front, so grow the underlying arrays once instead of repeatedly while
+        # adding structures one by one
+        self._reserve(
+            num_structures=len(self) + len(dataset),
+            num_atoms=self.current_element_index + sum(len(a) for a in dataset.atoms),
+        )
+        # check for optional columns once for the whole dataset, not for every row
+        arrays = [a for a in ("forces", "stress") if a in dataset.columns]
+        for name, atoms, energy, *values in zip(
+            dataset["name"], dataset["atoms"], dataset["energy"],
+            *(dataset[a] for a in arrays)
+        ):
             self.add_structure(
-                row.atoms, energy=row.energy, identifier=row.name, **kwargs
+                atoms, energy=energy, identifier=name, **dict(zip(arrays, values))
             )
 
+    def _reserve(self, num_structures, num_atoms):
+        """
+        Make sure that at least the given number of structures and atoms fit into the allocated arrays.
+
+        Args:
+            num_structures (int): total number of structures to fit
+            num_atoms (int): total number of atoms to fit
+        """
+        if num_structures > self._num_chunks_alloc:
+            self._resize_chunks(num_structures)
+        if num_atoms > self._num_elements_alloc:
+            self._resize_elements(num_atoms)
+
+    def trim(self):
+        """
+        Release memory allocated for structures and atoms beyond the ones added so far.
+
+        Since storage grows geometrically when adding structures, up to half of the allocation may be unused after
+        building a large storage.  Adding more structures afterwards is still possible.
+        """
+        self._resize_chunks(self.num_chunks)
+        self._resize_elements(self.num_elements)
+
     def to_list(self, filter_function=None):
         """
         Returns the data as lists of pyiron structures, energies, forces, and the number of atoms
@@ -580,6 +825,31 @@ class TrainingStorage(StructureStorage):
             dict_arrays[array] = self.get_array_ragged(array)
         return dict_arrays
 
+    def get_array_ragged(self, name: str) -> np.ndarray:
+        """
+        Return elements of array `name` in all chunks.  Values are returned in a ragged array of dtype=object.
+
+        If `name` specifies a per chunk array, there's nothing to split and this method is equivalent to
+        :method:`.get_array`.
+
+        Args:
+            name (str): name of array to fetch
+
+        Returns:
+            numpy.ndarray, dtype=object: ragged arrray of all elements in all chunks
+        """
+        if name in self._per_chunk_arrays:
+            return self.get_array(name)
+        # start indices of all structures are stored already, so split the flat array at them in one go instead of
+        # looking up the slice of every structure separately
+        values = np.split(self.get_array(name), self._per_chunk_arrays["start_index"][1 : len(self)])
+        # pre-allocated as dtype=object, then setting individual elements makes sure that element arrays retain their
+        # dtype
+        result = np.empty(len(self), dtype=object)
+        for i, v in enumerate(values[: len(self)]):
+            result[i] = v
+        return result
+
     def iter(self, *arrays, wrap_atoms=True):
         """
         Iterate over all structures in this object and all arrays that are defined
@@ -148,7 +148,22 @@ class NumpyArrayComparer(Comparer):
         # check if the datatype is inexact at all
         inexact = epsilon is not None
         if inexact:
-            return self.object.shape == b.shape and np.allclose(self.object, b, atol=fudge_factor*epsilon, rtol=0)
+            if self.object.shape != b.shape:
+                return False
+            if b.size == 0:
+                return True
+            atol = fudge_factor*epsilon
+            # max(|a - b|) <= atol with a single temporary, instead of the intermediates np.allclose allocates
+            with np.errstate(invalid="ignore"):
+                diff = np.subtract(self.object, b)
+            np.abs(diff, out=diff)
+            max_diff = diff.max()
+            if max_diff <= atol:
+                return True
+            if not np.isnan(max_diff):
+                return False
+            # NaN comes from NaN inputs or inf - inf; np.allclose treats matching infinities as close
+            return np.allclose(self.object, b, atol=atol, rtol=0)
         else:
             # it is an exact data type such as int
             return np.array_equal(self.object, b)
@@ -4,8 +4,11 @@
 
 import os
 import unittest
+import numpy as np
 from pyiron_atomistics._tests import TestWithCleanProject
+from pyiron_atomistics.atomistics.structure.structurestorage import StructureStorage
 import pyiron_contrib
+from pyiron_contrib.atomistics.atomistics.job.trainingcontainer import TrainingStorage
 
 
 class TestTrainingContainer(TestWithCleanProject):
@@ -41,12 +44,126 @@ class TestTrainingContainer(TestWithCleanProject):
     def test_elements(self):
         self.assertEqual(self.container.get_elements(), ["Al"])
 
+    def test_elements_preallocated(self):
+        storage = TrainingStorage(num_atoms=10, num_structures=5)
+        storage.add_structure(self.basis_1, energy=0.0)
+        self.assertEqual(storage.get_elements(), ["Al"],
+                         "get_elements() should ignore pre-allocated atoms.")
+        storage.set_array("symbols", 0, ["Cu"])
+        self.assertEqual(storage.get_elements(), ["Cu"],
+                         "get_elements() not updated after changing symbols.")
+
+    def test_trim(self):
+        storage = TrainingStorage(num_atoms=10, num_structures=5)
+        storage.add_structure(self.basis_2, energy=0.01, forces=[[0.0, 0.0, 0.0], [0.0, 0.0, 0.01]])
+        storage.trim()
+        self.assertEqual(storage._num_chunks_alloc, 1, "trim() did not shrink per structure arrays.")
+        self.assertEqual(storage._num_elements_alloc, 2, "trim() did not shrink per atom arrays.")
+        self.assertEqual(storage.get_structure(0), self.basis_2, "trim() changed stored structure.")
+        storage.add_structure(self.basis_1, energy=0.0)
+        self.assertEqual(len(storage), 2, "Adding structures after trim() failed.")
+        self.assertEqual(storage.get_structure(1), self.basis_1, "Adding structures after trim() failed.")
+
+    def test_missing_forces(self):
+        storage = TrainingStorage()
+        storage.add_structure(self.basis_2, energy=0.01, forces=[[0.0, 0.0, 0.0], [0.0, 0.0, 0.01]])
+        other = TrainingStorage()
+        other.add_structure(self.basis_1, energy=0.0)
+        storage.extend(other)
+        self.assertTrue(np.isnan(storage.get_array("forces", 1)).all(),
+                        "Structure added by extend() without forces should have NaN forces.")
+        storage.add_chunk(len(self.basis_1), identifier="chunk", symbols=self.basis_1.get_chemical_symbols(),
+                          positions=self.basis_1.positions)
+        self.assertTrue(np.isnan(storage.get_array("forces", 2)).all(),
+                        "Structure added by add_chunk() without forces should have NaN forces.")
+
+    def test_set_array_unchanged(self):
+        storage = TrainingStorage()
+        storage.add_structure(self.basis_1, energy=0.0, identifier="unitcell")
+        storage.add_structure(self.basis_2, energy=0.01, identifier="repeated")
+        self.assertEqual(storage.get_elements(), ["Al"])
+        storage.find_chunk("repeated")
+        element_cache = storage._element_cache
+        identifier_index = storage._identifier_index
+        storage.set_array("symbols", 0, self.basis_1.get_chemical_symbols())
+        storage.set_array("identifier", 0, "unitcell")
+        self.assertIs(storage._element_cache, element_cache,
+                      "Writing unchanged symbols should not reset the element cache.")
+        self.assertIs(storage._identifier_index, identifier_index,
+                      "Writing an unchanged identifier should not reset the identifier index.")
+        storage.set_array("energy", 0, 0.0)
+        storage.set_array("positions", 0, self.basis_1.positions)
+        self.assertIs(storage._element_cache, element_cache,
+                      "Writing other arrays should not reset the element cache.")
+        self.assertIs(storage._identifier_index, identifier_index,
+                      "Writing other arrays should not reset the identifier index.")
+        storage.set_array("identifier", 0, "renamed")
+        self.assertEqual(storage.find_chunk("renamed"), 0, "find_chunk() did not pick up changed identifier.")
+
+        symbols = storage.get_array("symbols", 1)
+        symbols[:] = "Cu"
+        storage.set_array("symbols", 1, symbols)
+        self.assertEqual(storage.get_elements(), ["Al", "Cu"],
+                         "get_elements() not updated after writing back a modified view.")
+
+    def test_get_array_ragged(self):
+        storage = TrainingStorage(num_atoms=10, num_structures=5)
+        storage.add_structure(self.basis_2, energy=0.01, forces=[[0.0, 0.0, 0.0], [0.0, 0.0, 0.01]])
+        storage.add_structure(self.basis_1, energy=0.0, forces=[[0.0, 0.1, 0.0]])
+        storage.add_structure(self.basis_2.repeat([2, 1, 1]), energy=0.02, forces=np.ones((4, 3)))
+        forces = storage.get_array_ragged("forces")
+        self.assertEqual(len(forces), len(storage), "get_array_ragged() returned wrong number of structures.")
+        for i, f in enumerate(forces):
+            self.assertTrue(np.array_equal(f, storage.get_array("forces", i)),
+                            f"get_array_ragged() returned wrong forces for {i}th structure.")
+            self.assertEqual(f.dtype, storage.get_array("forces", i).dtype,
+                             f"get_array_ragged() changed dtype for {i}th structure.")
+
     def test_get_structure(self):
         self.assertEqual(len(self.container.get_structure(frame=0)), 1,
                          "get_structure() returned wrong structure.")
         self.assertEqual(len(self.container.get_structure(frame=1)), 2,
                          "get_structure() returned wrong structure.")
 
+    def test_iter_structures(self):
+        storage = TrainingStorage()
+        structure_1 = self.project.create.structure.bulk("Fe", cubic=True)
+        structure_1[1] = "Ni"
+        structure_1.spins = [2.0, 0.5]
+        structure_1.add_tag(selective_dynamics=[True, True, True])
+        structure_1.selective_dynamics[1] = [False, False, True]
+        storage.add_structure(structure_1, energy=0.0)
+        structure_2 = self.project.create.structure.bulk("Al", cubic=True)
+        structure_2[0] = "Fe"
+        structure_2.spins = [2.0, 0.0, 0.0, 0.0]
+        structure_2.add_tag(selective_dynamics=[False, True, False])
+        storage.add_structure(structure_2, energy=0.0)
+
+        # compare against the upstream implementation, which does not go through _to_structure() like iter_structures()
+        structures = [StructureStorage._get_structure(storage, i) for i in range(len(storage))]
+        for i, (iterated, expected, original) in enumerate(
+                zip(storage.iter_structures(), structures, [structure_1, structure_2])):
+            self.assertEqual(iterated, original, f"iter_structures() returned wrong {i}th structure.")
+            self.assertEqual(iterated, expected, f"iter_structures() returned wrong {i}th structure.")
+            self.assertEqual(iterated.get_species_symbols().tolist(), expected.get_species_symbols().tolist(),
+                             f"iter_structures() returned wrong species for {i}th structure.")
+            self.assertTrue(np.array_equal(iterated.spins, expected.spins),
+                            f"iter_structures() returned wrong spins for {i}th structure.")
+            self.assertEqual(iterated.selective_dynamics.list(), expected.selective_dynamics.list(),
+                             f"iter_structures() returned wrong selective dynamics for {i}th structure.")
+        self.assertEqual(len(list(storage.iter_structures())), len(structures),
+                         "iter_structures() returned wrong number of structures.")
+
+    def test_get_structure_by_identifier(self):
+        storage = self.container._container
+        self.assertEqual(storage.get_structure(frame="repeated"), self.basis_2,
+                         "get_structure() returned wrong structure for identifier.")
+        storage.set_array("identifier", 0, "renamed")
+        self.assertEqual(storage.get_structure(frame="renamed"), self.basis_1,
+                         "get_structure() did not pick up changed identifier.")
+        with self.assertRaises(KeyError, msg="get_structure() should raise for stale identifier."):
+            storage.get_structure(frame="unitcell")
+
     def test_hdf(self):
         """Container read from HDF should match container written to HDF."""
 
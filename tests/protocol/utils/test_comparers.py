@@ -75,6 +75,23 @@ class TestComparer(unittest.TestCase):
         self.assertNotEqual(Comparer(a), c)
         self.assertNotEqual(Comparer(a), 'a')
 
+    def test_array_special_values(self):
+        a = np.array([1., np.inf, -np.inf])
+
+        self.assertEqual(Comparer(a), a.copy())
+        self.assertEqual(Comparer(np.zeros((0, 3))), np.zeros((0, 3)))
+
+        self.assertNotEqual(Comparer(a), np.array([1., np.inf, np.inf]))
+        self.assertNotEqual(Comparer(np.array([np.nan])), np.array([np.nan]))
+
+    def test_array_tolerance(self):
+        a = np.random.rand(100, 3)
+        b = a.copy()
+        b[42, 1] += 1e-6
+
+        self.assertEqual(Comparer(a), a + np.finfo(a.dtype).eps)
+        self.assertNotEqual(Comparer(a), b)
+
     def test_atoms(self):
         a, b, c, d = self.create_atoms()
 